@@ -1,7 +1,50 @@
 import pygame
 
+BROADPHASE_CELL_SIZE = 64  # pixels per grid cell (about the size of the largest enemy)
 
-def detect_enemy_player_collisions(player_rect, enemies, on_collision=None, shake_callback=None, shake_duration=0.12):
+
+def build_broadphase(enemies, cell_size=BROADPHASE_CELL_SIZE, grid=None):
+    """Bucket enemies into a uniform grid so collision checks only test nearby enemies.
+
+    - enemies: iterable of objects with x, y, size attributes
+    - cell_size: grid cell size in pixels
+    - grid: optional dict to reuse (it is cleared first)
+
+    Returns a dict mapping (cell_x, cell_y) -> list of enemies overlapping that cell.
+    """
+    if grid is None:
+        grid = {}
+    else:
+        grid.clear()
+    for e in enemies:
+        x0 = int(e.x) // cell_size
+        y0 = int(e.y) // cell_size
+        x1 = (int(e.x) + e.size) // cell_size
+        y1 = (int(e.y) + e.size) // cell_size
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                cell = grid.get((cx, cy))
+                if cell is None:
+                    grid[(cx, cy)] = [e]
+                else:
+                    cell.append(e)
+    return grid
+
+
+def query_broadphase(grid, rect, cell_size=BROADPHASE_CELL_SIZE):
+    """Return the enemies from `grid` whose cells overlap `rect` (each at most once)."""
+    found = []
+    seen = set()
+    for cx in range(rect.left // cell_size, rect.right // cell_size + 1):
+        for cy in range(rect.top // cell_size, rect.bottom // cell_size + 1):
+            for e in grid.get((cx, cy), ()):
+                if id(e) not in seen:
+                    seen.add(id(e))
+                    found.append(e)
+    return found
+
+
+def detect_enemy_player_collisions(player_rect, enemies, on_collision=None, shake_callback=None, shake_duration=0.12, broadphase=None):
     """Check collisions between a player rect and a list of Enemy instances.
 
     - player_rect: pygame.Rect for the player
@@ -9,9 +52,12 @@ def detect_enemy_player_collisions(player_rect, enemies, on_collision=None, shak
     - on_collision: optional callback called with the enemy instance when collision occurs
     - shake_callback: optional callback called with a duration (seconds) to trigger a screen shake
     - shake_duration: default duration passed to shake_callback when a collision happens
+    - broadphase: optional grid from `build_broadphase`; when given only nearby enemies are tested
 
     Returns a list of enemies that collided (caller may remove or handle them).
     """
+    if broadphase is not None:
+        enemies = query_broadphase(broadphase, player_rect)
     collided = []
     for e in enemies:
         enemy_rect = pygame.Rect(int(e.x), int(e.y), e.size, e.size)
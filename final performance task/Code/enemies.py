@@ -1,8 +1,9 @@
 import random
+from particles import ENEMY_STEP_SPEED_RANGE, ENEMY_STEP_SIZE_RANGE
 
 
 class Enemy:
-    def __init__(self, x, y, size=80, speed=120, color=(224, 184, 146), animation=None, particle_system=None, particle_color=None):
+    def __init__(self, x, y, size=80, speed=120, color=(224, 184, 146), animation=None, particle_system=None, particle_color=None, trail_buffer=None):
         # position
         self.x = x
         self.y = y
@@ -12,6 +13,7 @@ class Enemy:
         self.animation = animation  # optional Animation instance
         self.particle_system = particle_system  # optional ParticleSystem for effects
         self.particle_color = particle_color  # color for particles emitted by this enemy
+        self.trail_buffer = trail_buffer  # optional TrailBuffer, used instead of particles when set
         self.particle_emit_timer = 0.0
 
     def update(self, dt):
@@ -21,8 +23,19 @@ class Enemy:
         if self.animation:
             self.animation.update(dt)
         
+        # stamp into the trail buffer while moving (constant cost per stamp)
+        if self.trail_buffer:
+            self.particle_emit_timer += dt
+            if self.particle_emit_timer >= 0.03:  # stamp every 0.03 seconds
+                self.particle_emit_timer = 0.0
+                self.trail_buffer.stamp(
+                    self.x + self.size // 2,
+                    self.y + self.size,
+                    color=self.particle_color,
+                    size=3,
+                )
         # emit particles while moving (similar to player footsteps)
-        if self.particle_system:
+        elif self.particle_system:
             self.particle_emit_timer += dt
             if self.particle_emit_timer >= 0.08:  # emit every 0.08 seconds
                 self.particle_emit_timer = 0.0
@@ -31,25 +44,28 @@ class Enemy:
                     self.y + self.size,
                     count=2,
                     color=self.particle_color,  # use this enemy's particle color
-                    speed_range=(20, 60),
-                    size_range=(2, 4)
+                    speed_range=ENEMY_STEP_SPEED_RANGE,
+                    size_range=ENEMY_STEP_SIZE_RANGE
                 )
 
-    def draw(self, surface):
+    def draw(self, surface, scale=1.0):
         import pygame
 
+        # positions are logical pixels; `scale` maps them onto a smaller render surface
+        x, y = int(self.x * scale), int(self.y * scale)
+        size = max(1, int(self.size * scale))
         if self.animation:
-            self.animation.draw(surface, int(self.x), int(self.y), width=self.size, height=self.size)
+            self.animation.draw(surface, x, y, width=size, height=size)
         else:
-            pygame.draw.rect(surface, self.color, (int(self.x), int(self.y), self.size, self.size))
+            pygame.draw.rect(surface, self.color, (x, y, size, size))
 
     def is_offscreen(self, screen_height):
         return self.y > screen_height
 
 
-def spawn_enemy_random(screen_width, size_range=(30, 50), speed_range=(80, 180), animation=None, particle_system=None, particle_color=None):
+def spawn_enemy_random(screen_width, size_range=(30, 50), speed_range=(80, 180), animation=None, particle_system=None, particle_color=None, trail_buffer=None):
     size = random.randint(size_range[0], size_range[1])
     x = random.randint(0, max(0, screen_width - size))
     y = -size
     speed = random.uniform(speed_range[0], speed_range[1])
-    return Enemy(x, y, size=size, speed=speed, animation=animation, particle_system=particle_system, particle_color=particle_color)
+    return Enemy(x, y, size=size, speed=speed, animation=animation, particle_system=particle_system, particle_color=particle_color, trail_buffer=trail_buffer)
@@ -1,28 +1,53 @@
+import startup  # first, so the startup timeline covers every other import
 import pygame
 import random
 import os
+import sys
+from functools import partial
 from animation import Animation
-from particles import ParticleSystem
-from collisions import detect_enemy_player_collisions
+from particles import ParticleSystem, PLAYER_STEP_SPEED_RANGE, PLAYER_STEP_SIZE_RANGE, ENEMY_STEP_SPEED_RANGE, ENEMY_STEP_SIZE_RANGE
+from trails import TrailBuffer
+from render_scale import RenderScaler
+from collisions import detect_enemy_player_collisions, build_broadphase
+from jobs import JobScheduler
+from pacing import FramePacer
+from idle import IdleThrottle
+import stress
 from title_screen import show_title_screen
 import mouse
-import mixer  # initializes audio playback (primary + secondary overlay)
+import mixer
+import memory
+startup.mark('imports')
 
-# initialize pygame
+# initialize audio first so its buffer settings are used, then the rest of pygame
+mixer.init()
+startup.mark('mixer.init')
 pygame.init()
-pygame.mixer.init()
+startup.mark('pygame.init')
 
 
 # display
 WIDTH, HEIGHT = 1400, 900
+FPS = 60
+
+# frame pacing: "sleep" (least CPU), "hybrid" (sleep + busy-wait, even frame intervals),
+# "vsync" (wait for the monitor; uses a SCALED window, which SDL enlarges by an integer
+# factor on high-DPI desktops) or "uncapped"; JOBLIC_FRAME_PACING overrides it
+FRAME_PACING = os.environ.get('JOBLIC_FRAME_PACING', 'sleep')
+pacer = FramePacer(FPS, FRAME_PACING)
 
-screen = pygame.display.set_mode((WIDTH, HEIGHT))
+screen = pacer.set_display_mode((WIDTH, HEIGHT))
+
+# pause the game and title loops while the window is minimized or unfocused
+PAUSE_WHEN_UNFOCUSED = True
+idle = IdleThrottle(pause_on_focus_loss=PAUSE_WHEN_UNFOCUSED)
 pygame.display.set_caption("joblic")
 # initialize custom cursor (will look for `images/cursor.png`)
 try:
     mouse.init_custom_cursor()
 except Exception:
     pass
+startup.mark('display')
 
 # colors
 WHITE = (255, 255, 255)
@@ -43,9 +68,6 @@ BACKGROUND_COLOR = (50, 150, 200)
 # game
 running = True
 
-FPS = 60
-clock = pygame.time.Clock()
-
 player_size = 50
 player_x = WIDTH // 2 - player_size // 2
 player_y = HEIGHT - player_size - 100
@@ -74,6 +96,7 @@ try:
 except Exception as e:
     print('Warning: failed to load player animation:', e)
     use_anim = False
+startup.mark('player animation')
 
 # load player walking animation
 image_path_walk = os.path.normpath(os.path.join(os.path.dirname(__file__), '..', 'images', 'player_walk.png'))
@@ -84,6 +107,7 @@ try:
 except Exception as e:
     print(f'Warning: failed to load player walking animation:', e)
     player_walk_anim = None
+startup.mark('player walk animation')
 
 # enemies
 from enemies import Enemy, spawn_enemy_random
@@ -100,6 +124,7 @@ try:
 except Exception as e:
     print('Warning: failed to load enemy animation:', e)
     enemy_anim = None
+startup.mark('enemy animation')
 
 # load background image
 background_image_path = os.path.normpath(os.path.join(os.path.dirname(__file__), '..', 'images', 'background.png'))
@@ -111,10 +136,12 @@ try:
 except Exception as e:
     print(f'Warning: failed to load background image from {background_image_path}:', e)
     background_image = None
+startup.mark('background')
 
 # particle system for player walking
 particle_system = ParticleSystem(size_multiplier=4.0, color=(150, 150, 150))
 particle_emit_timer = 0.0
+PLAYER_PARTICLE_COLOR = (224, 184, 146)
 
 # particle system for enemies (red particles)
 enemy_particle_system = ParticleSystem(size_multiplier=3.0, color=(255, 100, 100))
@@ -122,6 +149,11 @@ enemy_particle_system = ParticleSystem(size_multiplier=3.0, color=(255, 100, 100
 # Control for enemy particle color - change this to adjust enemy particle appearance
 ENEMY_PARTICLE_COLOR = (165, 117, 70)  
 
+# Enemy effect mode: "particles" emits into enemy_particle_system (cost grows with live particles),
+# "trail" stamps into a persistent faded surface (cost grows with stamps per frame and the area they cover)
+ENEMY_EFFECT_MODE = "particles"
+enemy_trail_buffer = TrailBuffer(WIDTH, HEIGHT, fade_time=0.45, size_multiplier=3.0) if ENEMY_EFFECT_MODE == "trail" else None
+
 # Load custom font for HUD
 hud_font = None
 font_path = os.path.normpath(os.path.join(os.path.dirname(__file__), '..', 'fonts', 'font.ttf'))
@@ -131,6 +163,11 @@ try:
 except Exception as e:
     print(f'Warning: failed to load custom font from {font_path}:', e)
     hud_font = pygame.font.SysFont(None, 32)  # fallback to system font
+try:
+    stats_font = pygame.font.Font(font_path, 16)
+except Exception:
+    stats_font = pygame.font.SysFont(None, 20)
+startup.mark('fonts')
 
 # ============ SCREEN SHAKE CONFIGURATION ============
 SCREEN_SHAKE_ENABLED = True
@@ -146,24 +183,142 @@ screen_shake_offset_y = 0
 # set keys not released unready
 waiting_for_release = False
 
-# Create a temporary surface for rendering (used for screen shake effect)
-temp_surface = pygame.Surface((WIDTH, HEIGHT))
+# ============ RENDER SCALE CONFIGURATION ============
+RENDER_SCALE_ENABLED = False  # lower the internal resolution when frames take too long
+RENDER_SCALE_MIN = 0.5  # smallest internal scale (0.5 = 700x450)
+RENDER_SCALE_MAX = 1.0  # largest internal scale (1.0 = full WIDTH x HEIGHT)
+# ====================================================
+
+# Internal render surface (used for screen shake and resolution scaling);
+# gameplay stays in logical WIDTH x HEIGHT pixels and is scaled when drawn
+render_scaler = RenderScaler(WIDTH, HEIGHT, scale=RENDER_SCALE_MAX, min_scale=RENDER_SCALE_MIN,
+                             max_scale=RENDER_SCALE_MAX, target_ms=1000 / FPS, adaptive=RENDER_SCALE_ENABLED)
 
-# Show title screen before starting the game
-if not show_title_screen(screen, WIDTH, HEIGHT):
+# ============ MEMORY / GC CONFIGURATION ============
+GC_DEFER_COLLECTIONS = True  # only collect in spare frame time and on screen transitions
+GC_THRESHOLDS = None  # e.g. (5000, 20, 20) to let more objects build up between collections
+TRACE_ALLOCATIONS = False  # per-frame allocated bytes via tracemalloc (slows the game down)
+SHOW_FRAME_STATS = False  # frame stats overlay (toggle in game with F3)
+# ====================================================
+
+# ============ PARALLEL STAGES CONFIGURATION ============
+PARALLEL_STAGES = True  # only takes effect on free-threaded CPython builds (no GIL)
+JOB_WORKERS = None  # worker threads (None = number of cores - 1, at most 4)
+# =======================================================
+
+scheduler = JobScheduler(workers=JOB_WORKERS, parallel=None if PARALLEL_STAGES else False)
+broadphase = {}  # collision grid rebuilt every frame
+
+frame_stats = {}
+
+# stress test (--stress / JOBLIC_STRESS, see stress.py): fixed or ramping entity counts
+stress_test, stress_report_path = stress.from_args(sys.argv[1:], 1000 / FPS)
+if stress_test:
+    if not enemy_trail_buffer:
+        stress_test.skip('trail_stamps')
+    if stress_test.done:
+        print('Warning: nothing to stress test; trail_stamps needs ENEMY_EFFECT_MODE = "trail"')
+        pygame.quit()
+        exit()
+    # measure at a fixed render scale
+    render_scaler.adaptive = False
+
+# start background music (streamed from disk) and preload sound effects
+mixer.play_music('sound/bosa_nova')
+mixer.preload('sound/click.wav')
+startup.mark('music and sounds')
+
+# assets are loaded: keep them out of future collections
+memory.install()
+if GC_THRESHOLDS:
+    memory.set_thresholds(*GC_THRESHOLDS)
+memory.freeze()
+startup.mark('gc freeze')
+
+# Show title screen before starting the game (stress tests go straight to gameplay)
+if not stress_test and not show_title_screen(screen, WIDTH, HEIGHT, pacer=pacer, idle=idle):
     pygame.quit()
     exit()
 
+# screen transition: drop the title screen's garbage before gameplay starts
+memory.collect_now()
+if GC_DEFER_COLLECTIONS:
+    memory.defer_collections()
+if TRACE_ALLOCATIONS:
+    memory.start_tracing()
+# start frame timing fresh so the first gameplay dt does not include the title screen
+pacer.reset()
+
+
+# define a small callback to trigger screen shake from within collisions
+def _trigger_shake(duration):
+    # set the module-level screen_shake_timer
+    globals()["screen_shake_timer"] = duration
+
+
+# user collision handler placeholder - add your custom actions here
+def on_enemy_collision(enemy):
+    # TODO: add your custom collision handling here (e.g., reduce health, knockback)
+    # Example:
+    # player_health -= 1
+    pass
+
+
+def spawn_wave_enemy():
+    # create a copy of the animation for each enemy
+    enemy_anim_copy = enemy_anim.copy() if enemy_anim else None
+    return spawn_enemy_random(WIDTH, size_range=(30, 48), speed_range=(80 + wave_number * 10, 140 + wave_number * 15), animation=enemy_anim_copy, particle_system=enemy_particle_system, particle_color=ENEMY_PARTICLE_COLOR, trail_buffer=enemy_trail_buffer)
+
+
+def update_enemy_chunk(chunk, dt):
+    for e in chunk:
+        e.update(dt)
+
+
+first_frame = True
 while running:
     # frame timing
-    dt = clock.tick(FPS) / 1000.0
+    dt = pacer.tick()
+    # feed the time spent working on the last frame (without the frame wait);
+    # nothing was measured on the first frame after a reset (start or pause)
+    if pacer.measured:
+        render_scaler.record_frame(pacer.work_ms)
+        if stress_test:
+            stress_test.record_frame(pacer.work_ms)
+    if stress_test and stress_test.done:
+        running = False
+    memory.begin_frame()
 
     # event loop
     for event in pygame.event.get():
+        idle.handle_event(event)
         if event.type == pygame.QUIT:
             running = False
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+            SHOW_FRAME_STATS = not SHOW_FRAME_STATS
 
-    
+        # player dash (based on horizontal direction)
+        if event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_LSHIFT or event.key == pygame.K_RSHIFT:
+                if not waiting_for_release:
+                    print("Shift pressed. Now waiting for release...")
+                    waiting_for_release = True
+                    dash_speed = 20  # pixels per second
+                    player_xvel += dash_speed * player_horidir
+
+        if event.type == pygame.KEYUP:
+            if event.key == pygame.K_LSHIFT or event.key == pygame.K_RSHIFT:
+                waiting_for_release = False
+
+    # window minimized or unfocused: stop simulating and drawing until it is back
+    if idle.paused and running:
+        quit_requested, paused_ms = idle.wait()
+        if quit_requested:
+            running = False
+        # freeze the wave timer and restart frame timing so the next dt is not a spike
+        last_wave_time += paused_ms
+        pacer.reset()
+        continue
 
     # player movement (velocity based)
     keys = pygame.key.get_pressed()
@@ -180,20 +335,6 @@ while running:
     
 
 
-    # player dash (based on horizontal direction)
-    if event.type == pygame.KEYDOWN:
-            if event.key == pygame.K_LSHIFT or event.key == pygame.K_RSHIFT:
-                if not waiting_for_release:
-                    print("Shift pressed. Now waiting for release...")
-                    waiting_for_release = True
-                    dash_speed = 20  # pixels per second
-                    player_xvel += dash_speed * player_horidir
-                    
-    if event.type == pygame.KEYUP:
-        if event.key == pygame.K_LSHIFT or event.key == pygame.K_RSHIFT:
-            waiting_for_release = False
-
-
     # simple damping
     player_xvel = player_xvel / (1 + 6 * dt)
     player_yvel = player_yvel / (1 + 6 * dt)
@@ -216,53 +357,52 @@ while running:
                 player_x + player_size // 2,
                 player_y + player_size,
                 count=3,
-                color=(224, 184, 146),
-                speed_range=(30, 80),
-                size_range=(2, 5),
+                color=PLAYER_PARTICLE_COLOR,
+                speed_range=PLAYER_STEP_SPEED_RANGE,
+                size_range=PLAYER_STEP_SIZE_RANGE,
             )
     else:
         particle_emit_timer = 0.0
 
-    # update particles
-    particle_system.update(dt)
-    enemy_particle_system.update(dt)
-
-    # spawn waves
-    now = pygame.time.get_ticks()
-    if now - last_wave_time >= wave_interval:
-        wave_number += 1
-        # increase enemies per wave gradually
-        spawn_count = 3 + wave_number  # simple ramp
-        for i in range(spawn_count):
-            # create a copy of the animation for each enemy
-            enemy_anim_copy = enemy_anim.copy() if enemy_anim else None
-            e = spawn_enemy_random(WIDTH, size_range=(30, 48), speed_range=(80 + wave_number * 10, 140 + wave_number * 15), animation=enemy_anim_copy, particle_system=enemy_particle_system, particle_color=ENEMY_PARTICLE_COLOR)
-            enemies.append(e)
-        last_wave_time = now
-
-    # update enemies and remove offscreen ones
-    for e in enemies[:]:
-        e.update(dt)
-        if e.is_offscreen(HEIGHT):
-            enemies.remove(e)
+    # spawn waves (a stress test holds its own entity counts instead)
+    if stress_test:
+        stress.top_up_enemies(enemies, stress_test.target('enemies'), spawn_wave_enemy, HEIGHT)
+        stress.top_up_particles(particle_system, stress_test.target('player_particles'), WIDTH, HEIGHT,
+                                PLAYER_STEP_SPEED_RANGE, PLAYER_STEP_SIZE_RANGE, PLAYER_PARTICLE_COLOR)
+        stress.top_up_particles(enemy_particle_system, stress_test.target('enemy_particles'), WIDTH, HEIGHT,
+                                ENEMY_STEP_SPEED_RANGE, ENEMY_STEP_SIZE_RANGE, ENEMY_PARTICLE_COLOR)
+        if enemy_trail_buffer:
+            stress.stamp_trails(enemy_trail_buffer, stress_test.target('trail_stamps'), WIDTH, HEIGHT)
+    else:
+        now = pygame.time.get_ticks()
+        if now - last_wave_time >= wave_interval:
+            wave_number += 1
+            # increase enemies per wave gradually
+            spawn_count = 3 + wave_number  # simple ramp
+            for i in range(spawn_count):
+                enemies.append(spawn_wave_enemy())
+            last_wave_time = now
+
+    # update enemies in chunks (in parallel on free-threaded builds) and remove offscreen ones
+    scheduler.run_stage('enemies', [partial(update_enemy_chunk, chunk, dt) for chunk in scheduler.chunks(enemies)])
+    enemies[:] = [e for e in enemies if not e.is_offscreen(HEIGHT)]
+
+    # update particles, fade the enemy trails and build the collision grid;
+    # these touch separate data, and the stage waits for all of them before rendering
+    simulation_jobs = [
+        partial(particle_system.update, dt),
+        partial(enemy_particle_system.update, dt),
+        partial(build_broadphase, enemies, grid=broadphase),
+    ]
+    if enemy_trail_buffer:
+        simulation_jobs.append(partial(enemy_trail_buffer.update, dt))
+    scheduler.run_stage('simulation', simulation_jobs)
 
     # check collisions between enemies and player
     player_rect = pygame.Rect(int(player_x), int(player_y), player_size, player_size)
 
-    # define a small callback to trigger screen shake from within collisions
-    def _trigger_shake(duration):
-        # set the module-level screen_shake_timer
-        globals()["screen_shake_timer"] = duration
-
-    # user collision handler placeholder - add your custom actions here
-    def on_enemy_collision(enemy):
-        # TODO: add your custom collision handling here (e.g., reduce health, knockback)
-        # Example:
-        # player_health -= 1
-        pass
-
     # detect collisions; this will call _trigger_shake before on_enemy_collision
-    collided_enemies = detect_enemy_player_collisions(player_rect, enemies, on_collision=on_enemy_collision, shake_callback=_trigger_shake, shake_duration=0.12)
+    collided_enemies = detect_enemy_player_collisions(player_rect, enemies, on_collision=on_enemy_collision, shake_callback=_trigger_shake, shake_duration=0.12, broadphase=broadphase)
 
     # update screen shake
     if screen_shake_timer > 0:
@@ -274,19 +414,23 @@ while running:
             screen_shake_offset_x = random.randint(-SCREEN_SHAKE_INTENSITY, SCREEN_SHAKE_INTENSITY)
             screen_shake_offset_y = random.randint(-SCREEN_SHAKE_INTENSITY, SCREEN_SHAKE_INTENSITY)
 
-    # draw everything onto temporary surface
+    # draw everything onto the internal render surface
+    temp_surface = render_scaler.surface
+    scale = render_scaler.scale
     if background_image:
-        temp_surface.blit(background_image, (0, 0))
+        temp_surface.blit(render_scaler.scaled(background_image), (0, 0))
     else:
         temp_surface.fill(BACKGROUND_COLOR)
 
     # draw particles
-    particle_system.draw(temp_surface)
-    enemy_particle_system.draw(temp_surface)
+    particle_system.draw(temp_surface, scale)
+    enemy_particle_system.draw(temp_surface, scale)
+    if enemy_trail_buffer:
+        enemy_trail_buffer.draw(temp_surface, scale)
 
     # draw enemies
     for e in enemies:
-        e.draw(temp_surface)
+        e.draw(temp_surface, scale)
 
     # draw player (animated if available) - on top layer
     moving_threshold = 1.0
@@ -295,28 +439,70 @@ while running:
     if is_moving and player_walk_anim:
         # play walking animation when moving
         player_walk_anim.update(dt)
-        player_walk_anim.draw(temp_surface, player_x, player_y, width=player_size, height=player_size)
+        player_walk_anim.draw(temp_surface, player_x * scale, player_y * scale, width=player_size * scale, height=player_size * scale)
     elif use_anim and player_anim:
         # play idle animation when not moving
         player_anim.update(dt)
-        player_anim.draw(temp_surface, player_x, player_y, width=player_size, height=player_size)
+        player_anim.draw(temp_surface, player_x * scale, player_y * scale, width=player_size * scale, height=player_size * scale)
     else:
-        pygame.draw.rect(temp_surface, GREEN, (int(player_x), int(player_y), player_size, player_size))
+        pygame.draw.rect(temp_surface, GREEN, (int(player_x * scale), int(player_y * scale), int(player_size * scale), int(player_size * scale)))
 
-    # HUD: wave display at bottom middle
-    text = hud_font.render(f"Wave {wave_number}", True, BLACK)
-    text_rect = text.get_rect(center=(WIDTH // 2, HEIGHT - 60))
-    temp_surface.blit(text, text_rect)
+    # Upscale the render surface to the real screen with shake offset
+    render_scaler.present(screen, (screen_shake_offset_x, screen_shake_offset_y))
 
-    # Blit the temp surface to the real screen with shake offset
-    screen.fill(BLACK)
-    screen.blit(temp_surface, (screen_shake_offset_x, screen_shake_offset_y))
+    # HUD: wave display at bottom middle (drawn at full resolution so text stays sharp)
+    text = hud_font.render(f"Wave {wave_number}", True, BLACK)
+    text_rect = text.get_rect(center=(WIDTH // 2 + screen_shake_offset_x, HEIGHT - 60 + screen_shake_offset_y))
+    screen.blit(text, text_rect)
+
+    # frame stats overlay (F3)
+    if SHOW_FRAME_STATS:
+        frame_stats.update(memory.stats())
+        frame_stats.update(pacer.stats())
+        frame_stats['fps'] = frame_stats['pacing_fps']
+        frame_stats['render_scale'] = render_scaler.scale
+        frame_stats.update(scheduler.stats())
+        lines = [
+            f"FPS {frame_stats['fps']:.0f}  frame {frame_stats['frame_work_ms']:.1f} ms  scale {frame_stats['render_scale']:.2f}",
+            f"pacing {frame_stats['pacing_mode']}  interval {frame_stats['interval_mean_ms']:.2f} ms  jitter {frame_stats['interval_jitter_ms']:.2f} ms"
+            f"  p99 {frame_stats['interval_p99_ms']:.1f} ms  max {frame_stats['interval_max_ms']:.1f} ms",
+            f"GC {frame_stats['frame_gc_ms']:.2f} ms  max {frame_stats['gc_pause_max_ms']:.2f} ms  collections {frame_stats['gc_collections']}",
+            "GC pauses " + "  ".join(f"{label} {count}" for label, count in frame_stats['gc_pauses']),
+            f"alloc blocks {frame_stats['frame_blocks']:+d}",
+            f"jobs {'parallel x' + str(frame_stats['jobs_workers']) if frame_stats['jobs_parallel'] else 'serial'}  "
+            + "  ".join(f"{name} {ms:.2f} ms" for name, ms in frame_stats['jobs_stage_ms'].items()),
+        ]
+        if frame_stats['tracing']:
+            lines.append(f"alloc bytes {frame_stats['frame_alloc_bytes']:+d}  peak {frame_stats['frame_peak_bytes']}")
+        for i, line in enumerate(lines):
+            screen.blit(stats_font.render(line, True, WHITE, BLACK), (10, 10 + i * 20))
     # draw custom cursor on top
     try:
         mouse.draw_cursor(screen)
     except Exception:
         pass
+
+    # run deferred garbage collection in the time left before the next frame
+    # (before the present, which may block until vblank)
+    frame_work_ms = memory.end_frame()
+    memory.collect_idle(1000 / FPS - frame_work_ms)
+
+    pacer.end_work()
     pygame.display.update()
+    if first_frame:
+        first_frame = False
+        startup.mark('first gameplay frame')
+        startup.report()
+        if startup.benchmark_run():
+            running = False
 
 
+scheduler.shutdown()
+if stress_test:
+    stress_test.report({
+        'render_scale': render_scaler.scale,
+        'pacing': pacer.mode,
+        'enemy_effect': ENEMY_EFFECT_MODE,
+        'parallel_jobs': scheduler.stats()['jobs_workers'],
+    }, stress_report_path)
 pygame.quit()
\ No newline at end of file
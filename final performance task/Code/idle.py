@@ -0,0 +1,56 @@
+import pygame
+
+# window events that hide the game or take focus away, and the ones that bring it back
+# (looked up with getattr so older pygame versions without them still work)
+_HIDE_EVENTS = {getattr(pygame, name) for name in ('WINDOWMINIMIZED', 'WINDOWHIDDEN') if hasattr(pygame, name)}
+_SHOW_EVENTS = {getattr(pygame, name) for name in ('WINDOWRESTORED', 'WINDOWSHOWN', 'WINDOWMAXIMIZED') if hasattr(pygame, name)}
+_FOCUS_LOST = getattr(pygame, 'WINDOWFOCUSLOST', None)
+_FOCUS_GAINED = getattr(pygame, 'WINDOWFOCUSGAINED', None)
+
+
+class IdleThrottle:
+    """Pauses a loop while its window is minimized, hidden or (optionally) unfocused.
+
+    Feed every event to `handle_event`. When `paused` becomes True, call
+    `wait()`: it blocks on `pygame.event.wait` instead of simulating and
+    drawing frames, and returns once the window is back (or on QUIT).
+    """
+
+    def __init__(self, pause_on_focus_loss=True, wait_timeout_ms=250):
+        self.pause_on_focus_loss = pause_on_focus_loss
+        self.wait_timeout_ms = wait_timeout_ms  # how often the blocked loop wakes up
+        self.visible = True
+        self.focused = True
+        self.total_paused_ms = 0
+
+    @property
+    def paused(self):
+        return not self.visible or (self.pause_on_focus_loss and not self.focused)
+
+    def handle_event(self, event):
+        if event.type in _HIDE_EVENTS:
+            self.visible = False
+        elif event.type in _SHOW_EVENTS:
+            self.visible = True
+        elif event.type == _FOCUS_LOST:
+            self.focused = False
+        elif event.type == _FOCUS_GAINED:
+            self.focused = True
+
+    def wait(self):
+        """Block until the window is active again.
+
+        Returns (quit_requested, paused_ms). Other events that arrive while
+        paused are dropped.
+        """
+        start = pygame.time.get_ticks()
+        quit_requested = False
+        while self.paused:
+            event = pygame.event.wait(self.wait_timeout_ms)
+            if event.type == pygame.QUIT:
+                quit_requested = True
+                break
+            self.handle_event(event)
+        paused_ms = pygame.time.get_ticks() - start
+        self.total_paused_ms += paused_ms
+        return quit_requested, paused_ms
@@ -0,0 +1,70 @@
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+
+def free_threading_active():
+    """True when running on a free-threaded CPython build with the GIL disabled."""
+    is_gil_enabled = getattr(sys, '_is_gil_enabled', None)
+    return is_gil_enabled is not None and not is_gil_enabled()
+
+
+class JobScheduler:
+    """Runs independent per-frame stages on a small worker thread pool.
+
+    Each call to `run_stage` is a barrier: it returns only after every job
+    in the stage has finished, so the next stage (or the render) sees all of
+    its results. On GIL builds threads would only add overhead, so jobs run
+    one after another on the main thread instead.
+    """
+
+    def __init__(self, workers=None, parallel=None):
+        if parallel is None:
+            parallel = free_threading_active()
+        if workers is None:
+            # leave one core for the main thread, which also runs a share of each stage
+            workers = max(1, min(4, (os.cpu_count() or 1) - 1))
+        self.workers = workers
+        self.parallel = bool(parallel)
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='joblic-job') if self.parallel else None
+        self.stage_ms = {}  # stage name -> wall time of its last run in milliseconds
+
+    def chunks(self, items, min_chunk=16):
+        """Split `items` into one chunk per thread (a single chunk when serial)."""
+        count = len(items)
+        if not self.parallel or count <= min_chunk:
+            return [items]
+        parts = min(self.workers + 1, count // min_chunk)
+        size = -(-count // parts)  # ceiling division
+        return [items[i:i + size] for i in range(0, count, size)]
+
+    def run_stage(self, name, jobs):
+        """Run every callable in `jobs` and wait for all of them to finish."""
+        start = time.perf_counter()
+        if self._pool is None or len(jobs) < 2:
+            for job in jobs:
+                job()
+        else:
+            futures = [self._pool.submit(job) for job in jobs[1:]]
+            try:
+                # the main thread does its share instead of idling at the barrier
+                jobs[0]()
+            finally:
+                for future in futures:
+                    future.result()  # re-raises any exception from the worker
+        self.stage_ms[name] = (time.perf_counter() - start) * 1000.0
+
+    def shutdown(self):
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
+            self.parallel = False
+
+    def stats(self):
+        """Counters for the frame stats overlay."""
+        return {
+            'jobs_parallel': self.parallel,
+            'jobs_workers': self.workers if self.parallel else 0,
+            'jobs_stage_ms': dict(self.stage_ms),
+        }
@@ -0,0 +1,206 @@
+import gc
+import sys
+import time
+import tracemalloc
+
+# Runtime memory control for the game loop:
+# - `freeze()` moves everything loaded so far out of the collector's reach
+# - `defer_collections()` turns automatic GC off so collections only run
+#   from `collect_idle()` (frames with spare time) or `collect_now()`
+#   (screen transitions)
+# - a GC pause histogram (always on once `install()` is called) and
+#   optional tracemalloc-based allocation counters per frame
+
+# upper bounds (milliseconds) of the GC pause histogram buckets; the last bucket is open-ended
+PAUSE_BUCKETS_MS = (0.5, 1.0, 2.0, 4.0, 8.0, 16.0)
+
+# a deferred collection is forced once a generation grows past this many times its threshold
+FORCE_COLLECT_FACTOR = 10
+
+# a deferred full collection is forced at least this often, even without spare frame time
+FULL_COLLECT_INTERVAL_S = 30.0
+
+_installed = False
+_deferred = False
+_pause_start = None
+_pause_counts = [0] * (len(PAUSE_BUCKETS_MS) + 1)
+_pause_total_ms = 0.0
+_pause_max_ms = 0.0
+_collections = [0, 0, 0]  # per generation
+_last_full_collect = time.perf_counter()
+
+_frame_start = 0.0
+_frame_blocks = 0
+_frame_traced = 0
+_frame_pause_ms = 0.0
+_last_frame = {
+    'frame_work_ms': 0.0,
+    'frame_gc_ms': 0.0,
+    'frame_blocks': 0,
+    'frame_alloc_bytes': 0,
+    'frame_peak_bytes': 0,
+}
+
+
+def _gc_callback(phase, info):
+    global _pause_start, _pause_total_ms, _pause_max_ms, _frame_pause_ms
+    if phase == 'start':
+        _pause_start = time.perf_counter()
+        return
+    if _pause_start is None:
+        return
+    pause_ms = (time.perf_counter() - _pause_start) * 1000.0
+    _pause_start = None
+    _pause_total_ms += pause_ms
+    _pause_max_ms = max(_pause_max_ms, pause_ms)
+    _frame_pause_ms += pause_ms
+    generation = info.get('generation', 0)
+    if 0 <= generation < len(_collections):
+        _collections[generation] += 1
+    for i, bound in enumerate(PAUSE_BUCKETS_MS):
+        if pause_ms <= bound:
+            _pause_counts[i] += 1
+            break
+    else:
+        _pause_counts[-1] += 1
+
+
+def install():
+    """Start recording GC pauses into the histogram."""
+    global _installed
+    if not _installed:
+        gc.callbacks.append(_gc_callback)
+        _installed = True
+
+
+def freeze():
+    """Collect once, then move all surviving objects to the permanent generation.
+
+    Call after assets are loaded so later collections do not rescan them.
+    """
+    gc.collect()
+    gc.freeze()
+
+
+def set_thresholds(gen0, gen1=None, gen2=None):
+    """Set GC generation thresholds; omitted generations keep their current value."""
+    current = gc.get_threshold()
+    gc.set_threshold(gen0, current[1] if gen1 is None else gen1, current[2] if gen2 is None else gen2)
+
+
+def defer_collections():
+    """Disable automatic collections; the game calls `collect_idle` / `collect_now` instead."""
+    global _deferred
+    gc.disable()
+    _deferred = True
+
+
+def resume_collections():
+    global _deferred
+    gc.enable()
+    _deferred = False
+
+
+def collect_idle(slack_ms, min_slack_ms=2.0):
+    """Run a deferred collection if the frame has spare time.
+
+    Only the generations that are over their thresholds are collected. The
+    oldest generation is left for `collect_now`, unless its threshold is
+    exceeded and there is plenty of time. So that old cyclic garbage cannot
+    build up on machines that never have that much spare time, a full
+    collection is forced when the oldest generation is far over its
+    threshold or FULL_COLLECT_INTERVAL_S has passed since the last one.
+
+    The incremental collector in CPython 3.14 reports a threshold of 0 for
+    the oldest generation; then only the interval applies, and
+    `gc.collect(1)` runs an incremental step rather than a young collection.
+    Returns the generation collected, or None.
+    """
+    if not _deferred:
+        return None
+    count = gc.get_count()
+    threshold = gc.get_threshold()
+    # a zero threshold means the oldest generation has no count-based trigger
+    full_threshold = threshold[2] > 0
+    if ((full_threshold and count[2] >= threshold[2] * FORCE_COLLECT_FACTOR)
+            or time.perf_counter() - _last_full_collect >= FULL_COLLECT_INTERVAL_S):
+        _collect(2)
+        return 2
+    if count[0] < threshold[0]:
+        return None
+    forced = count[0] >= threshold[0] * FORCE_COLLECT_FACTOR
+    if slack_ms < min_slack_ms and not forced:
+        return None
+    generation = 0
+    if count[1] >= threshold[1]:
+        generation = 1
+        if full_threshold and count[2] >= threshold[2] and slack_ms >= min_slack_ms * 4:
+            generation = 2
+    _collect(generation)
+    return generation
+
+
+def collect_now(generation=2):
+    """Collect immediately; meant for screen transitions where a pause is not visible."""
+    return _collect(generation)
+
+
+def _collect(generation):
+    global _last_full_collect
+    collected = gc.collect(generation)
+    if generation == 2:
+        _last_full_collect = time.perf_counter()
+    return collected
+
+
+def start_tracing(frames=1):
+    """Turn on tracemalloc so frames also report allocated bytes (slows allocation)."""
+    if not tracemalloc.is_tracing():
+        tracemalloc.start(frames)
+
+
+def stop_tracing():
+    if tracemalloc.is_tracing():
+        tracemalloc.stop()
+
+
+def begin_frame():
+    global _frame_start, _frame_blocks, _frame_traced, _frame_pause_ms
+    _frame_pause_ms = 0.0
+    _frame_blocks = sys.getallocatedblocks()
+    if tracemalloc.is_tracing():
+        _frame_traced = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+    _frame_start = time.perf_counter()
+
+
+def end_frame():
+    """Finish the frame's counters and return the time spent on it in milliseconds."""
+    work_ms = (time.perf_counter() - _frame_start) * 1000.0
+    _last_frame['frame_work_ms'] = work_ms
+    _last_frame['frame_gc_ms'] = _frame_pause_ms
+    _last_frame['frame_blocks'] = sys.getallocatedblocks() - _frame_blocks
+    if tracemalloc.is_tracing():
+        current, peak = tracemalloc.get_traced_memory()
+        _last_frame['frame_alloc_bytes'] = current - _frame_traced
+        _last_frame['frame_peak_bytes'] = peak - _frame_traced
+    return work_ms
+
+
+def pause_histogram():
+    """Return [(label, count), ...] for the GC pause buckets."""
+    labels = [f"<={bound:g}ms" for bound in PAUSE_BUCKETS_MS] + [f">{PAUSE_BUCKETS_MS[-1]:g}ms"]
+    return list(zip(labels, _pause_counts))
+
+
+def stats():
+    """Counters for the frame stats overlay."""
+    result = dict(_last_frame)
+    result['gc_collections'] = tuple(_collections)
+    result['gc_pause_total_ms'] = _pause_total_ms
+    result['gc_pause_max_ms'] = _pause_max_ms
+    result['gc_pauses'] = pause_histogram()
+    result['gc_deferred'] = _deferred
+    result['gc_frozen'] = gc.get_freeze_count()
+    result['tracing'] = tracemalloc.is_tracing()
+    return result
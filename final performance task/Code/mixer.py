@@ -1,14 +1,133 @@
 import pygame
-pygame.init()
-pygame.mixer.init()
-
-music_file = "sound/bosa_nova.wav" 
-try:
-    pygame.mixer.music.load(music_file)
-    print(f"Loaded music: {music_file}")
-    
-except pygame.error as e:
-    print(f"Error loading music: {e}")
-    
-pygame.mixer.music.play(-1)  # loop indefinitely
-pygame.mixer.music.set_volume(0.5)  # set to 50% volume
\ No newline at end of file
+import os
+
+# Audio service: nothing here touches the audio device at import time.
+# Call `init()` once (before `pygame.init()` so the buffer settings stick);
+# every other function initializes on demand if that has not happened yet.
+
+FREQUENCY = 44100
+SAMPLE_SIZE = -16  # signed 16-bit samples
+CHANNELS = 2  # stereo
+BUFFER_SIZE = 512  # samples per buffer - smaller means lower latency but more CPU
+SFX_CHANNELS = 8  # fixed pool of channels reserved for sound effects
+
+# compressed formats are tried first so music is streamed from a smaller file
+MUSIC_EXTENSIONS = ('.ogg', '.mp3', '.wav')
+
+_base = os.path.normpath(os.path.join(os.path.dirname(__file__), '..'))
+_initialized = False
+_available = False
+_sounds = {}  # path -> pygame.mixer.Sound (None when the file could not be loaded)
+_channels = []
+_next_channel = 0
+
+
+def init(frequency=FREQUENCY, size=SAMPLE_SIZE, channels=CHANNELS, buffer=BUFFER_SIZE, sfx_channels=SFX_CHANNELS):
+    """Initialize the mixer once and allocate the sound effect channel pool.
+
+    Returns True if audio is available. Safe to call more than once.
+    """
+    global _initialized, _available, _channels, _next_channel
+    if _initialized:
+        return _available
+    _initialized = True
+    try:
+        if pygame.mixer.get_init() is None:
+            pygame.mixer.init(frequency, size, channels, buffer)
+        pygame.mixer.set_num_channels(sfx_channels)
+        _channels = [pygame.mixer.Channel(i) for i in range(sfx_channels)]
+        _next_channel = 0
+        _available = True
+    except pygame.error as e:
+        print(f"Warning: audio unavailable: {e}")
+        _available = False
+    return _available
+
+
+def resolve_path(path):
+    """Resolve `path` relative to the game folder (the parent of `Code`)."""
+    if os.path.isabs(path):
+        return os.path.normpath(path)
+    return os.path.normpath(os.path.join(_base, path))
+
+
+def find_music(name):
+    """Return the best available file for `name`, preferring compressed formats."""
+    stem, ext = os.path.splitext(resolve_path(name))
+    candidates = [stem + e for e in MUSIC_EXTENSIONS]
+    if ext and ext not in MUSIC_EXTENSIONS:
+        candidates.insert(0, stem + ext)
+    for candidate in candidates:
+        if os.path.exists(candidate):
+            return candidate
+    return None
+
+
+def play_music(name, volume=0.5, loops=-1):
+    """Stream background music from disk; `name` may omit the extension."""
+    if not init():
+        return False
+    music_file = find_music(name)
+    if music_file is None:
+        print(f"Error loading music: no file found for {name}")
+        return False
+    try:
+        pygame.mixer.music.load(music_file)
+        pygame.mixer.music.set_volume(volume)
+        pygame.mixer.music.play(loops)
+        print(f"Loaded music: {music_file}")
+        return True
+    except pygame.error as e:
+        print(f"Error loading music: {e}")
+        return False
+
+
+def stop_music():
+    if _available:
+        pygame.mixer.music.stop()
+
+
+def load_sound(path):
+    """Load a sound effect once and return the cached Sound (or None)."""
+    path = resolve_path(path)
+    if path in _sounds:
+        return _sounds[path]
+    sound = None
+    if init() and os.path.exists(path):
+        try:
+            sound = pygame.mixer.Sound(path)
+        except pygame.error as e:
+            print(f"Warning: failed to load sound {path}: {e}")
+    _sounds[path] = sound
+    return sound
+
+
+def preload(*paths):
+    """Load several sound effects up front so gameplay never hits the disk."""
+    for path in paths:
+        load_sound(path)
+
+
+def play_sound(sound, volume=1.0):
+    """Play a Sound (or a path to one) on the next channel from the pool.
+
+    When every channel is busy the oldest one is reused, so overlapping
+    effects never allocate new channels.
+    """
+    global _next_channel
+    if isinstance(sound, str):
+        sound = load_sound(sound)
+    if sound is None or not _channels:
+        return None
+    channel = None
+    for i in range(len(_channels)):
+        candidate = _channels[(_next_channel + i) % len(_channels)]
+        if not candidate.get_busy():
+            channel = candidate
+            break
+    if channel is None:
+        channel = _channels[_next_channel]
+    _next_channel = (_channels.index(channel) + 1) % len(_channels)
+    channel.set_volume(volume)
+    channel.play(sound)
+    return channel
@@ -0,0 +1,137 @@
+import time
+import statistics
+import pygame
+from collections import deque
+
+
+class FramePacer:
+    """Frame limiter with selectable strategies and frame-interval jitter stats.
+
+    Modes:
+    - "sleep": `Clock.tick`, lowest CPU use but limited by OS sleep granularity
+    - "hybrid": sleep for most of the frame, then `Clock.tick_busy_loop` spins
+      for the last `spin_ms`, giving even intervals for a little CPU
+    - "vsync": the display flip waits for the monitor (needs `set_display_mode`);
+      in case the driver ignores vsync, the desktop refresh rate (or
+      VSYNC_MAX_HZ if pygame cannot report it) is applied as a ceiling
+    - "uncapped": no limit, useful for measuring raw throughput
+
+    Call `end_work()` right before presenting the frame so `work_ms` leaves
+    out the flip, which blocks until vblank in vsync mode.
+    """
+
+    MODES = ('sleep', 'hybrid', 'vsync', 'uncapped')
+
+    # vsync: ceiling when the refresh rate is unknown, no display refreshes faster
+    VSYNC_MAX_HZ = 360
+
+    def __init__(self, fps=60, mode='sleep', spin_ms=2.0, window=240):
+        if mode not in self.MODES:
+            print(f"Warning: unknown frame pacing mode {mode!r}, using 'sleep'")
+            mode = 'sleep'
+        self.fps = fps
+        self.mode = mode
+        self.spin_ms = spin_ms  # hybrid: time left to busy-wait after sleeping
+        self.clock = pygame.time.Clock()
+        self.intervals = deque(maxlen=window)  # recent frame intervals in ms
+        self.work_ms = 0.0  # time spent on the last frame, excluding the present and the wait
+        self._last_tick = None
+        self._work_end = None  # set by end_work() for the current frame
+        self._refresh_rate = 0  # vsync: highest desktop refresh rate, 0 if pygame cannot tell
+        self.measured = False  # False on the first tick after a reset, when work_ms means nothing
+
+    def set_display_mode(self, size, flags=0):
+        """Create the display window; in vsync mode this requests vsync from SDL.
+
+        Note that vsync needs a SCALED display: SDL then scales the window by
+        the largest integer factor that fits the desktop (e.g. 2x on a 4K
+        screen) and maps mouse coordinates back to `size`.
+        """
+        if self.mode == 'vsync':
+            try:
+                # pygame only honours vsync for SCALED or OPENGL displays
+                screen = pygame.display.set_mode(size, flags | pygame.SCALED, vsync=1)
+                self._refresh_rate = _desktop_refresh_rate()
+                return screen
+            except pygame.error as e:
+                print(f"Warning: vsync unavailable ({e}), using 'hybrid' frame pacing")
+                self.mode = 'hybrid'
+        return pygame.display.set_mode(size, flags)
+
+    def end_work(self):
+        """Mark the end of the frame's work, just before the display update."""
+        self._work_end = time.perf_counter()
+
+    def tick(self):
+        """Wait for the next frame according to the mode; returns dt in seconds."""
+        now = time.perf_counter()
+        elapsed_ms = 0.0
+        self.measured = self._last_tick is not None
+        if self._last_tick is not None:
+            elapsed_ms = (now - self._last_tick) * 1000.0
+            work_end = self._work_end if self._work_end is not None else now
+            self.work_ms = (work_end - self._last_tick) * 1000.0
+        self._work_end = None
+
+        if self.mode == 'sleep':
+            ms = self.clock.tick(self.fps)
+        elif self.mode == 'hybrid':
+            if self._last_tick is not None:
+                remaining_ms = 1000.0 / self.fps - elapsed_ms - self.spin_ms
+                if remaining_ms > 0:
+                    time.sleep(remaining_ms / 1000.0)
+            ms = self.clock.tick_busy_loop(self.fps)
+        elif self.mode == 'vsync':
+            # the flip already waited for the display; a cap below the refresh rate would
+            # push every frame to a later vblank (e.g. 60 on 144 Hz settles at 48 fps)
+            ms = self.clock.tick(self._refresh_rate or self.VSYNC_MAX_HZ)
+        else:
+            ms = self.clock.tick()
+
+        now = time.perf_counter()
+        if self._last_tick is not None:
+            # measured with perf_counter, Clock only has millisecond resolution
+            self.intervals.append((now - self._last_tick) * 1000.0)
+        self._last_tick = now
+        return ms / 1000.0
+
+    def reset(self):
+        """Forget the last frame time, e.g. after a pause, so the next dt is not a huge spike."""
+        self.clock.tick()
+        self._last_tick = None
+        self._work_end = None
+        self.work_ms = 0.0
+        self.measured = False
+
+    def stats(self):
+        """Frame interval statistics for the frame stats overlay (milliseconds)."""
+        result = {
+            'pacing_mode': self.mode,
+            'pacing_fps': self.clock.get_fps(),
+            'interval_mean_ms': 0.0,
+            'interval_jitter_ms': 0.0,
+            'interval_p99_ms': 0.0,
+            'interval_max_ms': 0.0,
+        }
+        if len(self.intervals) >= 2:
+            intervals = sorted(self.intervals)
+            result['interval_mean_ms'] = statistics.fmean(intervals)
+            result['interval_jitter_ms'] = statistics.pstdev(intervals)
+            result['interval_p99_ms'] = intervals[min(len(intervals) - 1, int(len(intervals) * 0.99))]
+            result['interval_max_ms'] = intervals[-1]
+        return result
+
+
+def _desktop_refresh_rate():
+    """Highest refresh rate of the desktop displays, or 0 if unknown.
+
+    The highest one is used so the cap never binds on whichever display the
+    window is on; `get_desktop_refresh_rates` is missing from older pygame.
+    """
+    get_rates = getattr(pygame.display, 'get_desktop_refresh_rates', None)
+    if get_rates is None:
+        return 0
+    try:
+        return max(get_rates(), default=0)
+    except pygame.error:
+        return 0
@@ -2,6 +2,12 @@ import pygame
 import random
 import math
 
+# footstep emission used by gameplay; the stress test emits with the same values
+PLAYER_STEP_SPEED_RANGE = (30, 80)
+PLAYER_STEP_SIZE_RANGE = (2, 5)
+ENEMY_STEP_SPEED_RANGE = (20, 60)
+ENEMY_STEP_SIZE_RANGE = (2, 4)
+
 
 class Particle:
     def __init__(self, x, y, vx=0, vy=0, size=5, color=(255, 255, 255), lifespan=0.5):
@@ -21,13 +27,14 @@ class Particle:
         # simple gravity
         self.vy += 150 * dt
 
-    def draw(self, surface):
+    def draw(self, surface, scale=1.0):
         if self.is_alive():
             alpha = max(0, 255 * (1 - self.age / self.lifespan))
             color = (*self.color[:3], int(alpha))
-            s = pygame.Surface((self.size, self.size), pygame.SRCALPHA)
-            pygame.draw.circle(s, color, (self.size // 2, self.size // 2), self.size // 2)
-            surface.blit(s, (int(self.x) - self.size // 2, int(self.y) - self.size // 2))
+            size = max(1, int(self.size * scale))
+            s = pygame.Surface((size, size), pygame.SRCALPHA)
+            pygame.draw.circle(s, color, (size // 2, size // 2), size // 2)
+            surface.blit(s, (int(self.x * scale) - size // 2, int(self.y * scale) - size // 2))
 
     def is_alive(self):
         return self.age < self.lifespan
@@ -60,6 +67,6 @@ class ParticleSystem:
             if not p.is_alive():
                 self.particles.remove(p)
 
-    def draw(self, surface):
+    def draw(self, surface, scale=1.0):
         for p in self.particles:
-            p.draw(surface)
\ No newline at end of file
+            p.draw(surface, scale)
\ No newline at end of file
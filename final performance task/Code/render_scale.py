@@ -0,0 +1,88 @@
+import pygame
+from collections import deque
+
+
+class RenderScaler:
+    """Dynamic internal resolution for the game render.
+
+    The game draws into `surface`, which is `scale` times the logical size,
+    and `present` upscales it to the screen once per frame. Gameplay keeps
+    using logical pixels; draw calls multiply positions and sizes by `scale`.
+
+    When `adaptive` is on, the scale is lowered while the rolling average
+    frame time is over budget and raised again once there is headroom.
+    """
+
+    def __init__(self, width, height, scale=1.0, min_scale=0.5, max_scale=1.0, step=0.1,
+                 target_ms=1000 / 60, window=30, adaptive=True):
+        self.width = width
+        self.height = height
+        self.min_scale = min_scale
+        self.max_scale = max_scale
+        self.step = step
+        self.target_ms = target_ms  # frame budget in milliseconds
+        self.adaptive = adaptive
+        self.frame_times = deque(maxlen=window)  # recent frame work times in ms
+        self.scale = None
+        self.surface = None
+        self._scaled_cache = {}  # id(source) -> (source, scaled copy) for the current scale
+        self._upscaled = None  # full-size surface reused when upscaling with a shake offset
+        self.set_scale(scale)
+
+    def set_scale(self, scale):
+        """Resize the internal surface; scales are rounded to 0.05 steps."""
+        scale = round(max(self.min_scale, min(self.max_scale, scale)) * 20) / 20
+        if scale == self.scale:
+            return
+        self.scale = scale
+        self.surface = pygame.Surface(self.internal_size())
+        self._scaled_cache.clear()
+        self.frame_times.clear()
+
+    def internal_size(self):
+        return (max(1, int(self.width * self.scale)), max(1, int(self.height * self.scale)))
+
+    def scaled(self, image):
+        """Return `image` stretched to the internal size (cached until the scale changes).
+
+        Used for full-screen images such as the background.
+        """
+        if image.get_size() == self.surface.get_size():
+            return image
+        entry = self._scaled_cache.get(id(image))
+        if entry is None or entry[0] is not image:
+            entry = (image, pygame.transform.scale(image, self.internal_size()))
+            self._scaled_cache[id(image)] = entry
+        return entry[1]
+
+    def record_frame(self, frame_ms):
+        """Feed the time spent on the last frame (excluding the FPS sleep)."""
+        self.frame_times.append(frame_ms)
+        if not self.adaptive or len(self.frame_times) < self.frame_times.maxlen:
+            return
+        avg = sum(self.frame_times) / len(self.frame_times)
+        if avg > self.target_ms * 0.9 and self.scale > self.min_scale:
+            self.set_scale(self.scale - self.step)
+        elif avg < self.target_ms * 0.6 and self.scale < self.max_scale:
+            self.set_scale(self.scale + self.step)
+
+    def average_frame_ms(self):
+        if not self.frame_times:
+            return 0.0
+        return sum(self.frame_times) / len(self.frame_times)
+
+    def present(self, screen, offset=(0, 0)):
+        """Upscale the internal surface onto `screen` (offset in logical pixels)."""
+        ox, oy = offset
+        if self.scale == 1.0:
+            if ox or oy:
+                screen.fill((0, 0, 0))
+            screen.blit(self.surface, (ox, oy))
+        elif ox or oy:
+            if self._upscaled is None:
+                self._upscaled = pygame.Surface((self.width, self.height))
+            pygame.transform.scale(self.surface, (self.width, self.height), self._upscaled)
+            screen.fill((0, 0, 0))
+            screen.blit(self._upscaled, (ox, oy))
+        else:
+            pygame.transform.scale(self.surface, screen.get_size(), screen)
@@ -0,0 +1,175 @@
+"""Startup timeline tracer and cold/warm launch benchmark.
+
+Import this module first in `game.py`; `mark(name)` records a checkpoint
+when a startup phase finishes. Set JOBLIC_STARTUP_TRACE=1 to print the
+timeline once the first gameplay frame is shown, or set it to a file path
+ending in .json to export it instead.
+
+The timeline starts at the wall-clock time in JOBLIC_LAUNCH_TIME, so that
+interpreter startup is included; the benchmark sets it for every launch.
+Without it the timeline starts when this module is imported, not when the
+process started.
+
+Benchmark (headless, repeated launches):
+
+    python startup.py --runs 5
+"""
+import json
+import os
+import sys
+import time
+
+_t0 = time.perf_counter()
+_wall_t0 = time.time()
+_marks = []  # (name, seconds since _t0)
+_reported = False
+
+# wall-clock time the process was launched, set by the benchmark (or any launcher)
+# so interpreter startup is included in the timeline
+_launch_time = os.environ.get('JOBLIC_LAUNCH_TIME')
+if _launch_time:
+    try:
+        # move the origin back to the launch and count the gap as its own phase
+        _t0 -= _wall_t0 - float(_launch_time)
+        _marks.append(('interpreter startup', time.perf_counter() - _t0))
+    except ValueError:
+        pass
+
+
+def mark(name):
+    """Record that the startup phase `name` just finished."""
+    _marks.append((name, time.perf_counter() - _t0))
+
+
+def timeline():
+    """Return [{'phase', 'start_ms', 'duration_ms'}, ...] in the order recorded."""
+    result = []
+    previous = 0.0
+    for name, t in _marks:
+        result.append({'phase': name, 'start_ms': previous * 1000.0, 'duration_ms': (t - previous) * 1000.0})
+        previous = t
+    return result
+
+
+def format_timeline(entries):
+    lines = [f"{'phase':<28}{'start ms':>10}{'took ms':>10}"]
+    for entry in entries:
+        lines.append(f"{entry['phase']:<28}{entry['start_ms']:>10.1f}{entry['duration_ms']:>10.1f}")
+    return '\n'.join(lines)
+
+
+def benchmark_run():
+    """True during a benchmark launch: the title screen starts the game on its own
+    and the game quits after its first gameplay frame."""
+    return os.environ.get('JOBLIC_STARTUP_EXIT') == '1'
+
+
+def report():
+    """Print or export the timeline once, depending on JOBLIC_STARTUP_TRACE."""
+    global _reported
+    target = os.environ.get('JOBLIC_STARTUP_TRACE')
+    if _reported or not target:
+        return
+    _reported = True
+    entries = timeline()
+    if target.endswith('.json'):
+        with open(target, 'w') as f:
+            json.dump(entries, f, indent=2)
+    else:
+        print(format_timeline(entries))
+
+
+# ---------------------------------------------------------------------------
+# benchmark command
+
+def _run_once(game_path, headless, trace_path, pycache_dir):
+    import subprocess
+
+    env = dict(os.environ)
+    env['JOBLIC_STARTUP_EXIT'] = '1'
+    env['JOBLIC_STARTUP_TRACE'] = trace_path
+    # bytecode for every import (game, pygame, stdlib) is read from and written to here
+    env['PYTHONPYCACHEPREFIX'] = pycache_dir
+    env.pop('PYTHONDONTWRITEBYTECODE', None)
+    if headless:
+        env['SDL_VIDEODRIVER'] = 'dummy'
+        env['SDL_AUDIODRIVER'] = 'dummy'
+    # never read back a timeline left over from an earlier launch
+    if os.path.exists(trace_path):
+        os.remove(trace_path)
+    env['JOBLIC_LAUNCH_TIME'] = repr(time.time())
+    subprocess.run([sys.executable, game_path], env=env, check=True,
+                   stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    if not os.path.exists(trace_path):
+        raise RuntimeError('game exited without writing a startup timeline (it did not reach the first gameplay frame)')
+    with open(trace_path) as f:
+        return json.load(f)
+
+
+def _summarize(runs):
+    """Per phase: median/min/max of the end time (ms since launch) over all runs."""
+    import statistics
+
+    phases = {}
+    for entries in runs:
+        for entry in entries:
+            phases.setdefault(entry['phase'], []).append(entry['start_ms'] + entry['duration_ms'])
+    return {
+        phase: {'median_ms': statistics.median(v), 'min_ms': min(v), 'max_ms': max(v), 'runs': len(v)}
+        for phase, v in phases.items()
+    }
+
+
+def _print_summary(label, summary):
+    print(f"\n{label}")
+    print(f"{'phase (done at)':<28}{'median ms':>11}{'min ms':>9}{'max ms':>9}")
+    for phase, s in summary.items():
+        print(f"{phase:<28}{s['median_ms']:>11.1f}{s['min_ms']:>9.1f}{s['max_ms']:>9.1f}")
+
+
+def main(argv=None):
+    import argparse
+    import tempfile
+
+    parser = argparse.ArgumentParser(description='Measure cold and warm launch times of the game.')
+    parser.add_argument('--runs', type=int, default=5, help='launches per mode (default: 5)')
+    parser.add_argument('--visible', action='store_true', help='open a real window and audio device instead of running headless')
+    parser.add_argument('--json', metavar='PATH', help='also write the summary to PATH')
+    parser.add_argument('--fail-above', type=float, metavar='MS',
+                        help='exit with status 1 if the warm median to the first gameplay frame exceeds MS')
+    args = parser.parse_args(argv)
+
+    code_dir = os.path.dirname(os.path.abspath(__file__))
+    game_path = os.path.join(code_dir, 'game.py')
+    headless = not args.visible
+
+    with tempfile.TemporaryDirectory() as tmp:
+        trace_path = os.path.join(tmp, 'trace.json')
+        # cold: each launch gets an empty bytecode cache, so every imported module
+        # is compiled again (the OS file cache is not dropped; that needs root)
+        cold = []
+        for _ in range(args.runs):
+            cold.append(_run_once(game_path, headless, trace_path, tempfile.mkdtemp(dir=tmp)))
+        # warm: one bytecode cache shared by all launches, filled by an untimed priming run
+        warm_cache = tempfile.mkdtemp(dir=tmp)
+        _run_once(game_path, headless, trace_path, warm_cache)
+        warm = [_run_once(game_path, headless, trace_path, warm_cache) for _ in range(args.runs)]
+
+    summary = {'cold': _summarize(cold), 'warm': _summarize(warm)}
+    _print_summary(f'cold launches ({args.runs})', summary['cold'])
+    _print_summary(f'warm launches ({args.runs})', summary['warm'])
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(summary, f, indent=2)
+
+    if args.fail_above is not None:
+        first_frame = summary['warm'].get('first gameplay frame')
+        if first_frame is None or first_frame['median_ms'] > args.fail_above:
+            print(f"\nFAIL: warm launch to first gameplay frame is above {args.fail_above:.1f} ms")
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
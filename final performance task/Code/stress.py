@@ -0,0 +1,225 @@
+"""Synthetic stress mode for finding how much load the game can sustain.
+
+Enable it from the command line or the environment:
+
+    python game.py --stress ramp
+    python game.py --stress enemies=500,enemy_particles=3000
+    JOBLIC_STRESS=ramp:enemies,player_particles python game.py
+
+"ramp" raises the count of one subsystem at a time until the average frame
+work time goes over the frame budget, then reports the largest count that
+stayed within budget. A fixed spec holds the given counts for a while and
+reports the frame times. The game skips the title screen and wave spawning
+while a stress test runs, but everything is drawn through the normal render
+path. Add `--stress-report PATH` (or JOBLIC_STRESS_REPORT) to save the
+results as JSON.
+"""
+import json
+import os
+import random
+import statistics
+
+SUBSYSTEMS = ('enemies', 'player_particles', 'enemy_particles', 'trail_stamps')
+
+
+class StressTest:
+    """Drives entity counts per frame and records how long each frame took.
+
+    The game asks `target(name)` how many entities of a subsystem should
+    exist this frame and feeds back the frame work time via `record_frame`.
+    """
+
+    def __init__(self, budget_ms, fixed=None, subsystems=SUBSYSTEMS, start=10, growth=1.25,
+                 settle_frames=20, measure_frames=40, fixed_frames=600, max_count=100000):
+        self.budget_ms = budget_ms
+        self.fixed = fixed  # {subsystem: count} for a fixed run, None to ramp
+        self.subsystems = [s for s in subsystems if s in SUBSYSTEMS]
+        self.start = start
+        self.growth = growth  # count multiplier per ramp step
+        self.settle_frames = settle_frames  # frames ignored after a count change
+        self.measure_frames = measure_frames  # frames averaged per ramp step
+        self.fixed_frames = fixed_frames
+        self.max_count = max_count
+        self.done = False
+        self.results = {}
+
+        self._frame_times = []
+        self._frame = 0
+        self._index = 0  # subsystem being ramped
+        self._count = start
+        self._last_ok = None  # (count, avg ms) of the last step within budget
+
+    def skip(self, name):
+        """Drop a subsystem the game cannot drive, e.g. trails when they are off.
+
+        Call before the first frame.
+        """
+        if name in self.subsystems:
+            self.subsystems.remove(name)
+        if self.fixed is not None:
+            self.fixed.pop(name, None)
+        if not self.subsystems:
+            self.done = True
+
+    def current(self):
+        if self.fixed is not None or self._index >= len(self.subsystems):
+            return None
+        return self.subsystems[self._index]
+
+    def target(self, name):
+        """Number of `name` entities that should exist this frame."""
+        if self.done:
+            return 0
+        if self.fixed is not None:
+            return self.fixed.get(name, 0)
+        return self._count if name == self.current() else 0
+
+    def record_frame(self, work_ms):
+        if self.done:
+            return
+        self._frame += 1
+        if self.fixed is not None:
+            if self._frame > self.settle_frames:
+                self._frame_times.append(work_ms)
+            if self._frame >= self.settle_frames + self.fixed_frames:
+                self.results['fixed'] = self._summarize(dict(self.fixed))
+                self.done = True
+            return
+
+        if self._frame <= self.settle_frames:
+            return
+        self._frame_times.append(work_ms)
+        if len(self._frame_times) < self.measure_frames:
+            return
+
+        avg = statistics.fmean(self._frame_times)
+        if avg <= self.budget_ms and self._count < self.max_count:
+            self._last_ok = (self._count, avg)
+            self._next_step(max(self._count + 1, int(self._count * self.growth)))
+            return
+
+        name = self.current()
+        if avg <= self.budget_ms:
+            # hit max_count without going over budget
+            self._last_ok = (self._count, avg)
+        self.results[name] = {
+            'max_sustainable': self._last_ok[0] if self._last_ok else 0,
+            'avg_ms_at_max': self._last_ok[1] if self._last_ok else None,
+            'first_over_budget': None if avg <= self.budget_ms else self._count,
+            'avg_ms_over_budget': None if avg <= self.budget_ms else avg,
+        }
+        self._index += 1
+        self._last_ok = None
+        self._next_step(self.start)
+        if self._index >= len(self.subsystems):
+            self.done = True
+
+    def _next_step(self, count):
+        self._count = min(count, self.max_count)
+        self._frame = 0
+        self._frame_times = []
+
+    def _summarize(self, counts):
+        times = sorted(self._frame_times)
+        return {
+            'counts': counts,
+            'avg_ms': statistics.fmean(times) if times else 0.0,
+            'p95_ms': times[int(len(times) * 0.95)] if times else 0.0,
+            'max_ms': times[-1] if times else 0.0,
+            'within_budget': bool(times) and statistics.fmean(times) <= self.budget_ms,
+        }
+
+    def report(self, context=None, path=None):
+        """Print the results and optionally save them (with `context`) as JSON."""
+        context = context or {}
+        details = '  '.join(f"{k} {v}" for k, v in context.items())
+        print(f"\nstress test: budget {self.budget_ms:.1f} ms/frame  {details}")
+        if 'fixed' in self.results:
+            r = self.results['fixed']
+            print(f"counts {r['counts']}")
+            print(f"avg {r['avg_ms']:.2f} ms  p95 {r['p95_ms']:.2f} ms  max {r['max_ms']:.2f} ms  "
+                  f"{'within' if r['within_budget'] else 'OVER'} budget")
+        else:
+            print(f"{'subsystem':<20}{'max sustainable':>16}{'ms at max':>11}{'first over':>12}")
+            for name, r in self.results.items():
+                at_max = f"{r['avg_ms_at_max']:.2f}" if r['avg_ms_at_max'] is not None else '-'
+                over = r['first_over_budget'] if r['first_over_budget'] is not None else f">{self.max_count}"
+                print(f"{name:<20}{r['max_sustainable']:>16}{at_max:>11}{over:>12}")
+        if path:
+            with open(path, 'w') as f:
+                json.dump({'budget_ms': self.budget_ms, 'context': context, 'results': self.results}, f, indent=2)
+
+
+def parse_spec(spec):
+    """Parse "ramp", "ramp:a,b" or "name=count,..." into (fixed counts or None, subsystems)."""
+    spec = spec.strip()
+    if spec in ('', '1', 'ramp'):
+        return None, SUBSYSTEMS
+    if spec.startswith('ramp:'):
+        names = tuple(n.strip() for n in spec[5:].split(',') if n.strip())
+        unknown = [n for n in names if n not in SUBSYSTEMS]
+        if unknown:
+            raise ValueError(f"unknown stress subsystem(s): {', '.join(unknown)}")
+        return None, names
+    fixed = {}
+    for part in spec.split(','):
+        name, _, count = part.partition('=')
+        name = name.strip()
+        if name not in SUBSYSTEMS:
+            raise ValueError(f"unknown stress subsystem: {name}")
+        fixed[name] = int(count)
+        if fixed[name] < 0:
+            raise ValueError(f"negative stress count: {part.strip()}")
+    return fixed, tuple(fixed)
+
+
+def from_args(argv, budget_ms, environ=os.environ):
+    """Return (StressTest, report path) from --stress / JOBLIC_STRESS, or (None, None)."""
+    import argparse
+
+    parser = argparse.ArgumentParser(add_help=False)
+    parser.add_argument('--stress', nargs='?', const='ramp')
+    parser.add_argument('--stress-report')
+    args, _ = parser.parse_known_args(argv)
+    spec = args.stress if args.stress is not None else environ.get('JOBLIC_STRESS')
+    if not spec:
+        return None, None
+    try:
+        fixed, subsystems = parse_spec(spec)
+    except ValueError as e:
+        print(f"Warning: ignoring stress spec {spec!r}: {e}")
+        return None, None
+    report_path = args.stress_report or environ.get('JOBLIC_STRESS_REPORT')
+    return StressTest(budget_ms, fixed=fixed, subsystems=subsystems), report_path
+
+
+def top_up_enemies(enemies, count, spawn, height):
+    """Keep exactly `count` enemies alive, spawning new ones anywhere on screen."""
+    if len(enemies) > count:
+        del enemies[count:]
+    while len(enemies) < count:
+        e = spawn()
+        e.y = random.uniform(-e.size, height - e.size)
+        enemies.append(e)
+
+
+def top_up_particles(system, count, width, height, speed_range, size_range, color=None, batch=10):
+    """Emit into `system` until it holds at least `count` live particles.
+
+    Pass the same ranges and color as the gameplay emitter, so each particle
+    costs as much to draw as in the real game. Particles are only ever added,
+    so whatever the game emits on its own (e.g. enemy footsteps while
+    enemies are ramped) stays part of the load.
+    """
+    missing = count - len(system.particles)
+    while missing > 0:
+        n = min(batch, missing)
+        system.emit(random.uniform(0, width), random.uniform(0, height), count=n, color=color,
+                    speed_range=speed_range, size_range=size_range)
+        missing -= n
+
+
+def stamp_trails(trail_buffer, count, width, height):
+    """Stamp `count` random trail marks this frame."""
+    for _ in range(count):
+        trail_buffer.stamp(random.uniform(0, width), random.uniform(0, height), size=3)
@@ -2,6 +2,10 @@ import pygame
 import os
 import time
 import mouse
+import mixer
+import startup
+from pacing import FramePacer
+from idle import IdleThrottle
 import math
 
 
@@ -24,9 +28,11 @@ def _fit_image(img, max_w, max_h, allow_upscale=True):
     return img
 
 
-def show_title_screen(screen, WIDTH, HEIGHT):
+def show_title_screen(screen, WIDTH, HEIGHT, pacer=None, idle=None):
     """Render an image-only title screen using the provided `screen` surface.
 
+    `pacer` is the game's FramePacer (a default 60 FPS one is used if omitted)
+    and `idle` its IdleThrottle for pausing while the window is inactive.
     Returns True to start the game, False to quit.
     """
     # Do not re-init display here; expect `screen` provided from `game.py`.
@@ -35,8 +41,10 @@ def show_title_screen(screen, WIDTH, HEIGHT):
         if screen is None:
             screen = pygame.display.set_mode((WIDTH, HEIGHT))
 
-    clock = pygame.time.Clock()
-    FPS = 60
+    if pacer is None:
+        pacer = FramePacer(60)
+    if idle is None:
+        idle = IdleThrottle()
 
     # Appearance settings (larger sizes per request)
     TITLE_MAX_W, TITLE_MAX_H = 900, 260
@@ -109,16 +117,8 @@ def show_title_screen(screen, WIDTH, HEIGHT):
     HOVER_INCREMENT = 50
     HOVER_SCALE = 1.06
 
-    # Load click sound (optional)
-    click_sound = None
-    try:
-        if pygame.mixer.get_init() is None:
-            pygame.mixer.init()
-        click_path = os.path.join(base, 'sound', 'click.wav')
-        if os.path.exists(click_path):
-            click_sound = pygame.mixer.Sound(click_path)
-    except Exception:
-        click_sound = None
+    # Load click sound (optional, cached by the audio service)
+    click_sound = mixer.load_sound('sound/click.wav')
     # initialize custom cursor (optional)
     try:
         mouse.init_custom_cursor()
@@ -136,36 +136,40 @@ def show_title_screen(screen, WIDTH, HEIGHT):
     ROTATION_AMPLITUDE = 6.0  # degrees
     ROTATION_FREQUENCY = 0.9  # Hz
 
+    startup.mark('title assets')
+
+    first_frame = True
     running = True
     while running:
-        dt = clock.tick(FPS) / 1000.0
+        dt = pacer.tick()
         anim_t += dt
 
         for ev in pygame.event.get():
+            idle.handle_event(ev)
             if ev.type == pygame.QUIT:
                 return False
             if ev.type == pygame.MOUSEBUTTONDOWN:
                 if ev.button == 1 and button_rect.collidepoint(ev.pos):
-                    if click_sound:
-                        try:
-                            click_sound.play()
-                        except Exception:
-                            pass
+                    mixer.play_sound(click_sound)
                     # small delay so click sound can start
                     pygame.display.flip()
                     time.sleep(0.15)
                     return True
             if ev.type == pygame.KEYDOWN:
                 if ev.key in (pygame.K_SPACE, pygame.K_RETURN):
-                    if click_sound:
-                        try:
-                            click_sound.play()
-                        except Exception:
-                            pass
+                    mixer.play_sound(click_sound)
                     pygame.display.flip()
                     time.sleep(0.15)
                     return True
 
+        # minimized or unfocused: block instead of redrawing, then resume without a dt jump
+        if idle.paused:
+            quit_requested, _ = idle.wait()
+            if quit_requested:
+                return False
+            pacer.reset()
+            continue
+
         mx, my = pygame.mouse.get_pos()
 
         # determine hover and set target size accordingly (default or default + 50)
@@ -246,6 +250,14 @@ def show_title_screen(screen, WIDTH, HEIGHT):
         except Exception:
             pass
 
+        pacer.end_work()
         pygame.display.flip()
 
+        if first_frame:
+            first_frame = False
+            startup.mark('first title frame')
+            # benchmark launches go straight into the game
+            if startup.benchmark_run():
+                return True
+
     return True
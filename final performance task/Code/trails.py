@@ -0,0 +1,126 @@
+import pygame
+
+
+class TrailBuffer:
+    """Persistent trail surface that emitters stamp into.
+
+    Instead of keeping a list of live particles, every stamp is drawn once
+    into a screen-sized SRCALPHA surface which is faded each frame. The
+    buffer is split into tiles and only tiles stamped within the last
+    `fade_time` seconds are faded and drawn, so the cost per frame depends
+    on the stamps and the area they cover, not on the screen size.
+
+    Stamps are given in logical pixels; the buffer itself is kept at the
+    render scale passed to `draw` so it never has to be rescaled per frame.
+    """
+
+    TILE = 64  # tile size in buffer pixels
+
+    def __init__(self, width, height, fade_time=0.45, size_multiplier=1.0, color=(200, 200, 200)):
+        self.width = width
+        self.height = height
+        self.scale = 1.0
+        self.surface = pygame.Surface((width, height), pygame.SRCALPHA)
+        self.fade_time = fade_time  # seconds for a stamp to fade out completely
+        self.size_multiplier = size_multiplier  # easy way to scale all stamps
+        self.color = color  # default stamp color
+        self._stamp_cache = {}  # (color, size) -> prepared stamp surface
+        self._pending = []  # stamps queued since the last update
+        self._fade_remainder = 0.0  # fractional alpha carried between frames
+        self._tiles = {}  # (column, row) -> alpha still to fade out of that tile
+        self._fade_tile = pygame.Surface((self.TILE, self.TILE), pygame.SRCALPHA)
+        self._fade_alpha = None  # alpha currently filled into _fade_tile
+
+    def _get_stamp(self, color, size):
+        key = (color, size)
+        stamp = self._stamp_cache.get(key)
+        if stamp is None:
+            stamp = pygame.Surface((size, size), pygame.SRCALPHA)
+            pygame.draw.circle(stamp, (*color[:3], 255), (size // 2, size // 2), size // 2)
+            self._stamp_cache[key] = stamp
+        return stamp
+
+    def _tile_rect(self, tile):
+        return pygame.Rect(tile[0] * self.TILE, tile[1] * self.TILE, self.TILE, self.TILE)
+
+    def stamp(self, x, y, color=None, size=3):
+        """Queue a stamp centered at (x, y); it is drawn on the next update."""
+        if color is None:
+            color = self.color
+        size = max(1, int(size * self.size_multiplier))
+        self._pending.append((x, y, tuple(color[:3]), size))
+
+    def update(self, dt):
+        """Fade the tiles that still hold trails, then draw all queued stamps."""
+        self._fade_remainder += 255 * dt / self.fade_time
+        fade = int(self._fade_remainder)
+        if fade > 0 and self._tiles:
+            self._fade_remainder -= fade
+            fade = min(255, fade)
+            if fade != self._fade_alpha:
+                self._fade_tile.fill((0, 0, 0, fade))
+                self._fade_alpha = fade
+            # a blended blit, unlike a blended fill, has a SIMD path in pygame
+            tile_size = self.TILE
+            self.surface.blits([(self._fade_tile, (column * tile_size, row * tile_size), None, pygame.BLEND_RGBA_SUB)
+                                for column, row in self._tiles], doreturn=False)
+            for tile, remaining in list(self._tiles.items()):
+                if remaining <= fade:
+                    del self._tiles[tile]  # fully transparent again
+                else:
+                    self._tiles[tile] = remaining - fade
+        elif not self._tiles:
+            self._fade_remainder = 0.0
+
+        if self._pending:
+            scale = self.scale
+            tile_size = self.TILE
+            blits = []
+            for x, y, color, size in self._pending:
+                size = max(1, int(size * scale))
+                left = int(x * scale) - size // 2
+                top = int(y * scale) - size // 2
+                blits.append((self._get_stamp(color, size), (left, top)))
+                for column in range(max(0, left) // tile_size, max(0, left + size - 1) // tile_size + 1):
+                    for row in range(max(0, top) // tile_size, max(0, top + size - 1) // tile_size + 1):
+                        self._tiles[(column, row)] = 255
+            self.surface.blits(blits, doreturn=False)
+            self._pending.clear()
+
+    def set_scale(self, scale):
+        """Resize the buffer for a new render scale, keeping the visible trails."""
+        if scale == self.scale:
+            return
+        ratio = scale / self.scale
+        self.scale = scale
+        size = (max(1, int(self.width * scale)), max(1, int(self.height * scale)))
+        self.surface = pygame.transform.scale(self.surface, size)
+        # remap the live tiles onto the resized buffer
+        tiles = {}
+        for (column, row), remaining in self._tiles.items():
+            rect = self._tile_rect((column, row))
+            first_column, first_row = int(rect.left * ratio) // self.TILE, int(rect.top * ratio) // self.TILE
+            last_column, last_row = int(rect.right * ratio - 1) // self.TILE, int(rect.bottom * ratio - 1) // self.TILE
+            for c in range(first_column, last_column + 1):
+                for r in range(first_row, last_row + 1):
+                    tiles[(c, r)] = max(remaining, tiles.get((c, r), 0))
+        self._tiles = tiles
+
+    def clear(self):
+        self.surface.fill((0, 0, 0, 0))
+        self._pending.clear()
+        self._fade_remainder = 0.0
+        self._tiles.clear()
+
+    def draw(self, surface, scale=1.0):
+        self.set_scale(scale)
+        width, height = self.surface.get_size()
+        if len(self._tiles) * self.TILE * self.TILE > width * height // 2:
+            surface.blit(self.surface, (0, 0))
+            return
+        # only tiles stamped recently can hold anything visible
+        blits = []
+        for tile in self._tiles:
+            rect = self._tile_rect(tile)
+            blits.append((self.surface, rect.topleft, rect))
+        surface.blits(blits, doreturn=False)